@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import logging
-from asyncio import get_running_loop
+import os
+from asyncio import gather, get_running_loop
 from collections.abc import AsyncGenerator, Callable
 from concurrent.futures import ThreadPoolExecutor
 from contextvars import copy_context
+from functools import lru_cache, partial
 from inspect import isawaitable
 from typing import Any, cast
 
@@ -19,7 +21,6 @@ from asphalt.core import (
 from asphalt.sqlalchemy.utils import apply_sqlite_hacks
 from sqlalchemy.engine import Connection, Engine, create_engine
 from sqlalchemy.engine.url import URL, make_url
-from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
     AsyncEngine,
@@ -28,11 +29,41 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import Pool
+from sqlalchemy.pool import Pool, QueuePool, StaticPool
 
 logger = logging.getLogger(__name__)
 
 
+def _get_connection_capacity(bind: Connection | Engine) -> int | None:
+    # All sessions share the same connection when a connection is given as the bind,
+    # and StaticPool only ever holds a single connection
+    if isinstance(bind, Connection) or isinstance(bind.pool, StaticPool):
+        return 1
+
+    # Otherwise, only QueuePool (and its subclasses) enforce an upper limit on the
+    # number of connections checked out at once
+    pool = bind.pool
+    if isinstance(pool, QueuePool) and pool._max_overflow >= 0:
+        return pool.size() + pool._max_overflow
+
+    return None
+
+
+def _finish_session(session: Session, commit: bool) -> None:
+    try:
+        if commit:
+            session.commit()
+        else:
+            session.rollback()
+    finally:
+        session.close()
+
+
+@lru_cache(maxsize=128)
+def _parse_url(url: str) -> URL:
+    return make_url(url)
+
+
 class SQLAlchemyComponent(Component):
     """
     Creates resources necessary for accessing relational databases using SQLAlchemy.
@@ -66,6 +97,8 @@ class SQLAlchemyComponent(Component):
     :param bind: a connection or engine to use instead of creating a new engine
     :param prefer_async: if ``True``, try to create an async engine rather than a
         synchronous one, in cases like ``psycopg`` where the driver supports both
+        (drivers that only support one mode, like ``asyncpg`` or ``psycopg2``, always
+        get the matching engine type)
     :param engine_args: extra keyword arguments passed to
         :func:`sqlalchemy.future.engine.create_engine` or
         :func:`sqlalchemy.ext.asyncio.create_engine`
@@ -73,13 +106,24 @@ class SQLAlchemyComponent(Component):
         :class:`~sqlalchemy.orm.session.Session` or
         :class:`~sqlalchemy.ext.asyncio.AsyncSession`
     :param commit_executor_workers: maximum number of worker threads to use for tearing
-        down synchronous sessions (default: 5; ignored for asynchronous engines)
+        down synchronous sessions (default: the maximum number of connections the
+        engine's connection pool can hand out, 1 if ``bind`` is a connection or the
+        pool is a ``StaticPool``, or ``min(32, os.cpu_count() + 4)`` if the pool has no
+        such limit; ignored for asynchronous engines)
     :param ready_callback: a callable that is called right before the resources are
         added to the context (can be a coroutine function too)
     :param poolclass: the SQLAlchemy pool class (or a textual reference to one) to use;
         passed to :func:`sqlalchemy.future.engine.create_engine` or
         :func:`sqlalchemy.ext.asyncio.create_engine`
     :param resource_name: name space for the database resources
+    :param sqlite_pragmas: a mapping of ``PRAGMA`` names to the values to set on every
+        new SQLite connection (ignored for other databases, and when ``bind`` is
+        given)
+    :param prewarm_connections: number of connections to open in the connection pool
+        when the component starts, so that the first sessions don't have to wait for
+        new connections to be made (limited to the pool's ``pool_size``; ignored if
+        the pool does not keep a fixed number of connections, or when ``bind`` is a
+        connection)
     """
 
     commit_executor: ThreadPoolExecutor
@@ -97,12 +141,15 @@ class SQLAlchemyComponent(Component):
         prefer_async: bool = True,
         engine_args: dict[str, Any] | None = None,
         session_args: dict[str, Any] | None = None,
-        commit_executor_workers: int = 5,
+        commit_executor_workers: int | None = None,
         ready_callback: Callable[[Engine, sessionmaker], Any] | str | None = None,
         poolclass: str | type[Pool] | None = None,
         resource_name: str = "default",
+        sqlite_pragmas: dict[str, Any] | None = None,
+        prewarm_connections: int = 0,
     ):
         self.resource_name = resource_name
+        self.prewarm_connections = prewarm_connections
         self.commit_executor_workers = commit_executor_workers
         self.ready_callback = resolve_reference(ready_callback)
         engine_args = engine_args or {}
@@ -126,42 +173,52 @@ class SQLAlchemyComponent(Component):
             if isinstance(url, dict):
                 url = URL.create(**url)
             elif isinstance(url, str):
-                url = make_url(url)
+                url = _parse_url(url)
             elif url is None:
                 raise TypeError('both "url" and "bind" cannot be None')
 
+            backend_name = url.get_backend_name()
+
             # This is a hack to get SQLite to play nice with asphalt-sqlalchemy's
             # juggling of connections between multiple threads. The same connection
             # should, however, never be used in multiple threads at once.
-            if url.get_dialect().name == "sqlite":
+            if backend_name == "sqlite":
                 connect_args = engine_args.setdefault("connect_args", {})
                 connect_args.setdefault("check_same_thread", False)
 
+                # An in-memory database only lives as long as its connection, so
+                # every session needs to share the same connection (StaticPool does
+                # not accept pool_size, which the default SingletonThreadPool does)
+                if (
+                    poolclass is None
+                    and url.database in (None, "", ":memory:")
+                    and "pool_size" not in engine_args
+                ):
+                    poolclass = StaticPool
+
             if isinstance(poolclass, str):
                 poolclass = resolve_reference(poolclass)
 
             pool_class = cast("type[Pool]", poolclass)
+            # Check which kind of driver is available up front instead of trying to
+            # create an engine of the wrong kind first
+            dialect_cls = url.get_dialect()
             if prefer_async:
-                try:
-                    self.engine = self._async_bind = create_async_engine(
-                        url, poolclass=pool_class, **engine_args
-                    )
-                except InvalidRequestError:
-                    self.engine = self._bind = create_engine(
-                        url, poolclass=pool_class, **engine_args
-                    )
+                use_async = dialect_cls.get_async_dialect_cls(url).is_async
             else:
-                try:
-                    self.engine = self._bind = create_engine(
-                        url, poolclass=pool_class, **engine_args
-                    )
-                except InvalidRequestError:
-                    self.engine = self._async_bind = create_async_engine(
-                        url, poolclass=pool_class, **engine_args
-                    )
-
-            if url.get_dialect().name == "sqlite":
-                apply_sqlite_hacks(self.engine)
+                use_async = dialect_cls.is_async
+
+            if use_async:
+                self.engine = self._async_bind = create_async_engine(
+                    url, poolclass=pool_class, **engine_args
+                )
+            else:
+                self.engine = self._bind = create_engine(
+                    url, poolclass=pool_class, **engine_args
+                )
+
+            if backend_name == "sqlite":
+                apply_sqlite_hacks(self.engine, sqlite_pragmas)
 
         if isinstance(self.engine, AsyncEngine):
             # This is needed for listening to ORM events when async sessions are used
@@ -174,41 +231,78 @@ class SQLAlchemyComponent(Component):
         else:
             self._sessionmaker = sessionmaker(bind=self._bind, **session_args)
 
-    def create_session(self, ctx: Context) -> Session:
-        async def teardown_session(exception: BaseException | None) -> None:
-            try:
-                if session.in_transaction():
-                    context = copy_context()
-                    if exception is None:
-                        await get_running_loop().run_in_executor(
-                            self.commit_executor, context.run, session.commit
-                        )
-                    else:
-                        await get_running_loop().run_in_executor(
-                            self.commit_executor, context.run, session.rollback
-                        )
-            finally:
-                session.close()
+    async def _teardown_session(
+        self, session: Session, exception: BaseException | None
+    ) -> None:
+        if session.in_transaction():
+            # Closing the session returns the connection to the pool, which may involve
+            # I/O too, so do it in the same worker thread that ends the transaction
+            context = copy_context()
+            await get_running_loop().run_in_executor(
+                self.commit_executor,
+                context.run,
+                _finish_session,
+                session,
+                exception is None,
+            )
+        else:
+            session.close()
+
+    async def _teardown_async_session(
+        self, session: AsyncSession, exception: BaseException | None
+    ) -> None:
+        try:
+            if session.in_transaction():
+                if exception is None:
+                    await session.commit()
+                else:
+                    await session.rollback()
+        finally:
+            await session.close()
 
+    def create_session(self, ctx: Context) -> Session:
         session = self._sessionmaker()
-        ctx.add_teardown_callback(teardown_session, pass_exception=True)
+        ctx.add_teardown_callback(
+            partial(self._teardown_session, session), pass_exception=True
+        )
         return session
 
     def create_async_session(self, ctx: Context) -> AsyncSession:
-        async def teardown_session(exception: BaseException | None) -> None:
-            try:
-                if session.in_transaction():
-                    if exception is None:
-                        await session.commit()
-                    else:
-                        await session.rollback()
-            finally:
-                await session.close()
-
         session: AsyncSession = self._async_sessionmaker()
-        ctx.add_teardown_callback(teardown_session, pass_exception=True)
+        ctx.add_teardown_callback(
+            partial(self._teardown_async_session, session), pass_exception=True
+        )
         return session
 
+    def _get_prewarm_count(
+        self, bind: Connection | Engine | AsyncConnection | AsyncEngine
+    ) -> int:
+        if isinstance(bind, (Engine, AsyncEngine)) and isinstance(bind.pool, QueuePool):
+            return min(self.prewarm_connections, bind.pool.size())
+
+        return 0
+
+    async def _prewarm_pool(self, engine: Engine) -> None:
+        loop = get_running_loop()
+        connections = await gather(
+            *[
+                loop.run_in_executor(self.commit_executor, engine.connect)
+                for _ in range(self._get_prewarm_count(engine))
+            ]
+        )
+        await gather(
+            *[
+                loop.run_in_executor(self.commit_executor, connection.close)
+                for connection in connections
+            ]
+        )
+
+    async def _prewarm_async_pool(self, engine: AsyncEngine) -> None:
+        connections = await gather(
+            *[engine.connect().start() for _ in range(self._get_prewarm_count(engine))]
+        )
+        await gather(*[connection.close() for connection in connections])
+
     @context_teardown
     async def start(self, ctx: Context) -> AsyncGenerator[None, Exception | None]:
         bind: Connection | Engine | AsyncConnection | AsyncEngine
@@ -219,6 +313,9 @@ class SQLAlchemyComponent(Component):
                     await retval
 
             bind = self._async_bind
+            if isinstance(bind, AsyncEngine):
+                await self._prewarm_async_pool(bind)
+
             ctx.add_resource(self.engine, self.resource_name)
             ctx.add_resource(self._sessionmaker, self.resource_name)
             ctx.add_resource(self._async_sessionmaker, self.resource_name)
@@ -233,10 +330,31 @@ class SQLAlchemyComponent(Component):
                 if isawaitable(retval):
                     await retval
 
-            self.commit_executor = ThreadPoolExecutor(self.commit_executor_workers)
+            # Committing more sessions in parallel than there are connections available
+            # would just leave the extra worker threads waiting on the pool
+            workers = self.commit_executor_workers
+            capacity = _get_connection_capacity(self._bind)
+            if workers is None:
+                workers = capacity or min(32, (os.cpu_count() or 1) + 4)
+            elif capacity is not None and workers > capacity:
+                logger.warning(
+                    "commit_executor_workers (%d) exceeds the maximum number of "
+                    "database connections available (%d) for SQLAlchemy resources "
+                    "(%s)",
+                    workers,
+                    capacity,
+                    self.resource_name,
+                )
+
+            self.commit_executor = ThreadPoolExecutor(
+                workers, thread_name_prefix=f"sqlalchemy-commit-{self.resource_name}"
+            )
             ctx.add_teardown_callback(self.commit_executor.shutdown)
 
             bind = self._bind
+            if isinstance(bind, Engine):
+                await self._prewarm_pool(bind)
+
             ctx.add_resource(self.engine, self.resource_name)
             ctx.add_resource(self._sessionmaker, self.resource_name)
             ctx.add_resource_factory(
@@ -1,34 +1,138 @@
 from __future__ import annotations
 
-import sqlite3
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any, cast
 
-from sqlalchemy import event
+from sqlalchemy import event, inspect
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 from sqlalchemy.future import Connection, Engine
 from sqlalchemy.pool import ConnectionPoolEntry
 from sqlalchemy.sql.schema import MetaData
 
+if TYPE_CHECKING:
+    import sqlite3
 
-def clear_database(engine: Engine | Connection, schemas: Iterable[str] = ()) -> None:
-    """
-    Clear any tables from an existing database using a synchronous connection/engine.
 
-    :param engine: the engine or connection to use
-    :param schemas: full list of schema names to expect (ignored for SQLite)
+def _drop_all_batched(
+    connection: Connection, all_schemas: Iterable[str | None]
+) -> None:
+    # Drop all the views and tables with (at most) one statement of each kind, instead
+    # of one statement per object as MetaData.drop_all() does. Only the names of the
+    # objects are needed for this, so they're not reflected.
+    inspector = inspect(connection)
+    preparer = connection.dialect.identifier_preparer
+    quote, quote_schema = preparer.quote, preparer.quote_schema
+    is_postgresql = connection.dialect.name == "postgresql"
+    views: list[str] = []
+    tables: list[str] = []
+    enums: list[str] = []
+    for schema in all_schemas:
+        prefix = f"{quote_schema(schema)}." if schema else ""
+        views += [prefix + quote(name) for name in inspector.get_view_names(schema)]
+        tables += [prefix + quote(name) for name in inspector.get_table_names(schema)]
+
+        if is_postgresql:
+            # Enum types used by the dropped tables would otherwise be left behind.
+            # Passing None would return all enums visible on the search path, so the
+            # default schema must be named explicitly.
+            enum_schema = schema or inspector.default_schema_name
+            for enum in inspector.get_enums(enum_schema):  # type: ignore[attr-defined]
+                enums.append(f"{quote_schema(enum['schema'])}.{quote(enum['name'])}")
+
+    if is_postgresql:
+        if views:
+            connection.exec_driver_sql(
+                f"DROP VIEW IF EXISTS {', '.join(views)} CASCADE"
+            )
+        if tables:
+            connection.exec_driver_sql(
+                f"DROP TABLE IF EXISTS {', '.join(tables)} CASCADE"
+            )
+        if enums:
+            connection.exec_driver_sql(
+                f"DROP TYPE IF EXISTS {', '.join(enums)} CASCADE"
+            )
+    else:
+        # MySQL does not support CASCADE, so foreign key checks are disabled instead
+        foreign_key_checks = int(
+            connection.exec_driver_sql("SELECT @@FOREIGN_KEY_CHECKS").scalar_one()
+        )
+        connection.exec_driver_sql("SET FOREIGN_KEY_CHECKS = 0")
+        try:
+            if views:
+                connection.exec_driver_sql(f"DROP VIEW IF EXISTS {', '.join(views)}")
+            if tables:
+                connection.exec_driver_sql(f"DROP TABLE IF EXISTS {', '.join(tables)}")
+        finally:
+            connection.exec_driver_sql(f"SET FOREIGN_KEY_CHECKS = {foreign_key_checks}")
+
+
+def _clear_sqlite_database(connection: Connection) -> None:
+    # Only the names are needed, so skip reflection and read them from the catalog
+    result = connection.exec_driver_sql(
+        "SELECT type, name FROM sqlite_master WHERE type IN ('table', 'view') "
+        "AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\' ORDER BY type DESC"
+    )
+    quote = connection.dialect.identifier_preparer.quote
+    table_names: list[str] = []
+    for type_, name in cast("list[tuple[str, str]]", result.all()):
+        if type_ == "view":
+            connection.exec_driver_sql(f"DROP VIEW {quote(name)}")
+        else:
+            table_names.append(name)
+
+    if table_names and connection.exec_driver_sql("PRAGMA foreign_keys").scalar():
+        # The tables must be dropped in dependency order when foreign keys are enforced
+        metadata = MetaData()
+        metadata.reflect(connection)
+        metadata.drop_all(connection, checkfirst=False)
+    else:
+        for name in table_names:
+            connection.exec_driver_sql(f"DROP TABLE {quote(name)}")
+
+
+def _clear_database(connection: Connection, schemas: Iterable[str]) -> None:
+    if connection.dialect.name == "sqlite":
+        _clear_sqlite_database(connection)
+        return
 
-    """
-    metadatas = []
     all_schemas: tuple[str | None, ...] = (None,)
     all_schemas += tuple(schemas)
+    if connection.dialect.name in ("postgresql", "mysql"):
+        _drop_all_batched(connection, all_schemas)
+        return
+
+    metadatas = []
     for schema in all_schemas:
         # Reflect the schema to get the list of the tables, views and constraints
         metadata = MetaData()
-        metadata.reflect(engine, schema=schema, views=True)
+        metadata.reflect(connection, schema=schema, views=True)
         metadatas.append(metadata)
 
     for metadata in metadatas:
-        metadata.drop_all(engine, checkfirst=False)
+        if metadata.tables:
+            metadata.drop_all(connection, checkfirst=False)
+
+
+def clear_database(engine: Engine | Connection, schemas: Iterable[str] = ()) -> None:
+    """
+    Clear any tables from an existing database using a synchronous connection/engine.
+
+    On PostgreSQL and MySQL, only the names of the views and tables are looked up, and
+    they are dropped with a single statement per object type. On SQLite, the tables and
+    views are looked up directly from ``sqlite_master``, and the tables are only
+    reflected if foreign keys are enforced.
+
+    :param engine: the engine or connection to use
+    :param schemas: full list of schema names to expect (ignored for SQLite)
+
+    """
+    # Do all the reflection and dropping through a single connection and transaction
+    if isinstance(engine, Engine):
+        with engine.begin() as connection:
+            _clear_database(connection, schemas)
+    else:
+        _clear_database(engine, schemas)
 
 
 async def clear_async_database(
@@ -41,46 +145,49 @@ async def clear_async_database(
     :param schemas: full list of schema names to expect (ignored for SQLite)
 
     """
-    metadatas = []
-    all_schemas: tuple[str | None, ...] = (None,)
-    all_schemas += tuple(schemas)
-    for schema in all_schemas:
-        # Reflect the schema to get the list of the tables, views and constraints
-        metadata = MetaData()
-        await connection.run_sync(metadata.reflect, schema=schema, views=True)
-        metadatas.append(metadata)
+    await connection.run_sync(clear_database, schemas)
 
-    for metadata in metadatas:
-        await connection.run_sync(metadata.drop_all, checkfirst=False)
+
+def _sqlite_do_connect(
+    dbapi_connection: sqlite3.Connection, connection_record: ConnectionPoolEntry
+) -> None:
+    # disable pysqlite's emitting of the BEGIN statement entirely.
+    # also stops it from emitting COMMIT before any DDL.
+    dbapi_connection.isolation_level = None
+
+
+def _sqlite_do_begin(conn: Connection) -> None:
+    # emit our own BEGIN
+    conn.exec_driver_sql("BEGIN")
 
 
-def apply_sqlite_hacks(engine: Engine | AsyncEngine) -> None:
+def apply_sqlite_hacks(
+    engine: Engine | AsyncEngine, pragmas: Mapping[str, Any] | None = None
+) -> None:
     """
     Apply hacks for ``SAVEPOINT`` support on pysqlite based engines.
 
+    Optionally, this also sets the given ``PRAGMA`` values on every new connection
+    (e.g. ``{"journal_mode": "WAL", "synchronous": "NORMAL"}``).
+
     This function is automatically called by the component, and only needs to be
     explicitly used by the developer when using an SQLite connection for database
     integration tests (the connection is passed to the component as the ``bind``
     option).
 
+    The ``SAVEPOINT`` hacks are only applied once per engine, even if this function is
+    called several times for it (each call with ``pragmas`` does, however, add another
+    listener that sets them).
+
     .. seealso:: https://docs.sqlalchemy.org/en/14/dialects/sqlite.html\
 #pysqlite-serializable
 
     :param engine: an engine using the sqlite dialect
+    :param pragmas: a mapping of ``PRAGMA`` names to the values to set on every new
+        connection
 
     """
 
-    def do_connect(
-        dbapi_connection: sqlite3.Connection, connection_record: ConnectionPoolEntry
-    ) -> None:
-        # disable pysqlite's emitting of the BEGIN statement entirely.
-        # also stops it from emitting COMMIT before any DDL.
-        dbapi_connection.isolation_level = None
-
-    def do_begin(conn: Connection) -> None:
-        # emit our own BEGIN
-        conn.exec_driver_sql("BEGIN")
-
     if not engine.dialect.name == "sqlite":
         raise ValueError(
             f"SQLite hacks can only applied to an engine with dialect "
@@ -88,5 +195,20 @@ def apply_sqlite_hacks(engine: Engine | AsyncEngine) -> None:
         )
 
     sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
-    event.listen(sync_engine, "connect", do_connect)
-    event.listen(sync_engine, "begin", do_begin)
+    if not event.contains(sync_engine, "connect", _sqlite_do_connect):
+        event.listen(sync_engine, "connect", _sqlite_do_connect)
+        event.listen(sync_engine, "begin", _sqlite_do_begin)
+
+    if pragmas:
+
+        def set_pragmas(
+            dbapi_connection: sqlite3.Connection, connection_record: ConnectionPoolEntry
+        ) -> None:
+            cursor = dbapi_connection.cursor()
+            try:
+                for name, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {name} = {value}")
+            finally:
+                cursor.close()
+
+        event.listen(sync_engine, "connect", set_pragmas)
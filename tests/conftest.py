@@ -2,21 +2,35 @@ from __future__ import annotations
 
 import os
 from collections.abc import AsyncGenerator, Generator
+from importlib.util import find_spec
+from pathlib import Path
 from typing import Any, cast
 
 import pytest
 from _pytest.fixtures import SubRequest
 from pytest import TempPathFactory
-from pytest_lazy_fixtures import lf
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.future import Engine, create_engine
+from sqlalchemy.pool import NullPool, StaticPool
 
 from asphalt.sqlalchemy.utils import apply_sqlite_hacks
 
 
-@pytest.fixture(scope="session")
-def anyio_backend() -> str:
-    return "asyncio"
+@pytest.fixture(
+    params=[
+        pytest.param(("asyncio", {}), id="asyncio"),
+        pytest.param(
+            ("asyncio", {"use_uvloop": True}),
+            id="asyncio+uvloop",
+            marks=pytest.mark.skipif(
+                find_spec("uvloop") is None, reason="uvloop is not available"
+            ),
+        ),
+    ],
+    scope="session",
+)
+def anyio_backend(request: SubRequest) -> tuple[str, dict[str, Any]]:
+    return cast("tuple[str, dict[str, Any]]", request.param)
 
 
 @pytest.fixture(scope="session")
@@ -44,14 +58,14 @@ def asyncmy_url(mysql_url: str) -> str:
 
 @pytest.fixture(scope="session")
 def pymysql_engine(mysql_url: str) -> Generator[Engine, Any, None]:
-    engine = create_engine(mysql_url)
+    engine = create_engine(mysql_url, poolclass=NullPool)
     yield engine
     engine.dispose()
 
 
 @pytest.fixture(scope="session")
 def psycopg_engine(psycopg_url: str) -> Generator[Engine, Any, None]:
-    engine = create_engine(psycopg_url, echo=True)
+    engine = create_engine(psycopg_url, poolclass=NullPool)
     yield engine
     engine.dispose()
 
@@ -59,7 +73,9 @@ def psycopg_engine(psycopg_url: str) -> Generator[Engine, Any, None]:
 @pytest.fixture(scope="session")
 def sqlite_memory_engine() -> Generator[Engine, Any, None]:
     engine = create_engine(
-        "sqlite:///:memory:", connect_args=dict(check_same_thread=False)
+        "sqlite:///:memory:",
+        connect_args=dict(check_same_thread=False),
+        poolclass=StaticPool,
     )
     apply_sqlite_hacks(engine)
     yield engine
@@ -67,23 +83,28 @@ def sqlite_memory_engine() -> Generator[Engine, Any, None]:
 
 
 @pytest.fixture(scope="session")
-def sqlite_file_engine(
-    tmp_path_factory: TempPathFactory,
-) -> Generator[Engine, Any, None]:
+def _sqlite_db_path(tmp_path_factory: TempPathFactory) -> Generator[Path, Any, None]:
     db_path = tmp_path_factory.mktemp("asphalt-sqlalchemy") / "test.db"
+    yield db_path
+    if db_path.exists():
+        db_path.unlink()
+
+
+@pytest.fixture(scope="session")
+def sqlite_file_engine(_sqlite_db_path: Path) -> Generator[Engine, Any, None]:
     engine = create_engine(
-        f"sqlite:///{db_path}", connect_args=dict(check_same_thread=False)
+        f"sqlite:///{_sqlite_db_path}",
+        connect_args=dict(check_same_thread=False),
+        poolclass=NullPool,
     )
     apply_sqlite_hacks(engine)
     yield engine
     engine.dispose()
-    if db_path.exists():
-        db_path.unlink()
 
 
 @pytest.fixture(scope="session")
 async def aiosqlite_memory_engine() -> AsyncGenerator[AsyncEngine, Any]:
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
     apply_sqlite_hacks(engine)
     yield engine
     await engine.dispose()
@@ -91,52 +112,51 @@ async def aiosqlite_memory_engine() -> AsyncGenerator[AsyncEngine, Any]:
 
 @pytest.fixture(scope="session")
 async def aiosqlite_file_engine(
-    tmp_path_factory: TempPathFactory,
+    _sqlite_db_path: Path,
 ) -> AsyncGenerator[AsyncEngine, Any]:
-    db_path = tmp_path_factory.mktemp("asphalt-sqlalchemy") / "test.db"
-    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{_sqlite_db_path}", poolclass=NullPool
+    )
     apply_sqlite_hacks(engine)
     yield engine
     await engine.dispose()
-    if db_path.exists():
-        db_path.unlink()
 
 
 @pytest.fixture(scope="session")
 async def psycopg_async_engine(psycopg_url: str) -> AsyncGenerator[AsyncEngine, Any]:
-    engine = create_async_engine(psycopg_url)
+    engine = create_async_engine(psycopg_url, poolclass=NullPool)
     yield engine
     await engine.dispose()
 
 
 @pytest.fixture(scope="session")
 async def asyncmy_engine(asyncmy_url: str) -> AsyncGenerator[AsyncEngine, Any]:
-    engine = create_async_engine(asyncmy_url)
+    engine = create_async_engine(asyncmy_url, poolclass=NullPool)
     yield engine
     await engine.dispose()
 
 
 @pytest.fixture(
     params=[
-        lf("sqlite_memory_engine"),
-        lf("sqlite_file_engine"),
-        lf("pymysql_engine"),
-        lf("psycopg_engine"),
+        "sqlite_memory_engine",
+        "sqlite_file_engine",
+        "pymysql_engine",
+        "psycopg_engine",
     ],
     scope="session",
 )
 def sync_engine(request: SubRequest) -> Engine:
-    return cast(Engine, request.param)
+    return cast(Engine, request.getfixturevalue(request.param))
 
 
 @pytest.fixture(
     params=[
-        lf("aiosqlite_memory_engine"),
-        lf("aiosqlite_file_engine"),
-        lf("psycopg_async_engine"),
-        lf("asyncmy_engine"),
+        "aiosqlite_memory_engine",
+        "aiosqlite_file_engine",
+        "psycopg_async_engine",
+        "asyncmy_engine",
     ],
     scope="session",
 )
-async def async_engine(request: SubRequest) -> AsyncEngine:
-    return cast(AsyncEngine, request.param)
+def async_engine(request: SubRequest) -> AsyncEngine:
+    return cast(AsyncEngine, request.getfixturevalue(request.param))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import gc
+import os
 from contextlib import ExitStack
 from pathlib import Path
 from threading import Thread, current_thread
@@ -20,7 +21,13 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.future import Engine, create_engine
 from sqlalchemy.orm.session import Session, sessionmaker
-from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    NullPool,
+    QueuePool,
+    SingletonThreadPool,
+    StaticPool,
+)
 from sqlalchemy.sql import text
 
 from asphalt.sqlalchemy.component import SQLAlchemyComponent
@@ -197,6 +204,160 @@ async def test_close_twice_async(psycopg_url: str) -> None:
     assert pool.checkedout() == 0
 
 
+@pytest.mark.parametrize(
+    "component_opts, expected_workers",
+    [
+        pytest.param({}, 15, id="default"),
+        pytest.param({"engine_args": {"max_overflow": 2}}, 7, id="max_overflow"),
+        pytest.param(
+            {"poolclass": NullPool},
+            min(32, (os.cpu_count() or 1) + 4),
+            id="unlimited",
+        ),
+        pytest.param({"poolclass": StaticPool}, 1, id="static"),
+        pytest.param({"commit_executor_workers": 3}, 3, id="explicit"),
+    ],
+)
+async def test_commit_executor_workers(
+    component_opts: dict[str, Any], expected_workers: int, tmp_path: Path
+) -> None:
+    """
+    Test that the commit executor is sized after the connection pool unless told
+    otherwise.
+
+    """
+    component = SQLAlchemyComponent(
+        url=f"sqlite:///{tmp_path / 'test.db'}", **component_opts
+    )
+    async with Context() as ctx:
+        await component.start(ctx)
+        assert component.commit_executor._max_workers == expected_workers
+
+
+async def test_commit_executor_workers_exceed_pool(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that a warning is logged if there are more workers than connections."""
+    component = SQLAlchemyComponent(
+        url=f"sqlite:///{tmp_path / 'test.db'}", commit_executor_workers=20
+    )
+    async with Context() as ctx:
+        await component.start(ctx)
+        assert component.commit_executor._max_workers == 20
+
+    assert caplog.messages[0] == (
+        "commit_executor_workers (20) exceeds the maximum number of database "
+        "connections available (15) for SQLAlchemy resources (default)"
+    )
+
+
+async def test_commit_executor_workers_bind_connection(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """
+    Test that the commit executor gets a single worker when all sessions share the same
+    connection.
+
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    with engine.connect() as connection:
+        component = SQLAlchemyComponent(bind=connection)
+        async with Context() as ctx:
+            await component.start(ctx)
+            assert component.commit_executor._max_workers == 1
+
+    engine.dispose()
+    assert not caplog.messages
+
+
+@pytest.mark.parametrize("url", ["sqlite:///:memory:", "sqlite+aiosqlite:///:memory:"])
+def test_sqlite_memory_static_pool(url: str) -> None:
+    """Test that in-memory SQLite databases use a single, shared connection."""
+    component = SQLAlchemyComponent(url=url)
+    assert isinstance(component.engine.pool, StaticPool)
+
+
+def test_sqlite_memory_explicit_pool() -> None:
+    """Test that an explicitly given pool class overrides the in-memory default."""
+    component = SQLAlchemyComponent(url="sqlite:///:memory:", poolclass=NullPool)
+    assert isinstance(component.engine.pool, NullPool)
+
+
+async def test_sqlite_memory_pool_args() -> None:
+    """
+    Test that pool sizing arguments for an in-memory database are passed to the default
+    pool class instead of StaticPool.
+
+    """
+    component = SQLAlchemyComponent(
+        url="sqlite:///:memory:", engine_args={"pool_size": 10}
+    )
+    assert isinstance(component.engine.pool, SingletonThreadPool)
+
+
+async def test_sqlite_pragmas_sync(tmp_path: Path) -> None:
+    """Test that the given PRAGMAs are set on new synchronous SQLite connections."""
+    component = SQLAlchemyComponent(
+        url=f"sqlite:///{tmp_path / 'test.db'}",
+        sqlite_pragmas={"journal_mode": "WAL", "cache_size": -4000},
+    )
+    async with Context() as ctx:
+        await component.start(ctx)
+        session = ctx.require_resource(Session)
+        assert session.scalar(text("PRAGMA journal_mode")) == "wal"
+        assert session.scalar(text("PRAGMA cache_size")) == -4000
+
+
+async def test_sqlite_pragmas_async(tmp_path: Path) -> None:
+    """Test that the given PRAGMAs are set on new asynchronous SQLite connections."""
+    component = SQLAlchemyComponent(
+        url=f"sqlite+aiosqlite:///{tmp_path / 'test.db'}",
+        sqlite_pragmas={"journal_mode": "WAL", "cache_size": -4000},
+    )
+    async with Context() as ctx:
+        await component.start(ctx)
+        session = ctx.require_resource(AsyncSession)
+        assert await session.scalar(text("PRAGMA journal_mode")) == "wal"
+        assert await session.scalar(text("PRAGMA cache_size")) == -4000
+
+
+@pytest.mark.parametrize(
+    "scheme, prewarm_connections, expected",
+    [
+        pytest.param("sqlite", 3, 3, id="sync"),
+        pytest.param("sqlite+aiosqlite", 3, 3, id="async"),
+        pytest.param("sqlite", 10, 5, id="pool_size"),
+    ],
+)
+async def test_prewarm_connections(
+    tmp_path: Path, scheme: str, prewarm_connections: int, expected: int
+) -> None:
+    """Test that the given number of connections are opened in the pool on startup."""
+    component = SQLAlchemyComponent(
+        url=f"{scheme}:///{tmp_path / 'test.db'}",
+        prewarm_connections=prewarm_connections,
+    )
+    async with Context() as ctx:
+        await component.start(ctx)
+        assert component.engine.pool.checkedin() == expected  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize(
+    "url, prefer_async, engine_class",
+    [
+        pytest.param("sqlite://", True, Engine, id="sync_driver_prefer_async"),
+        pytest.param("sqlite://", False, Engine, id="sync_driver"),
+        pytest.param("sqlite+aiosqlite://", True, AsyncEngine, id="async_driver"),
+        pytest.param(
+            "sqlite+aiosqlite://", False, AsyncEngine, id="async_driver_prefer_sync"
+        ),
+    ],
+)
+def test_engine_class(url: str, prefer_async: bool, engine_class: type) -> None:
+    component = SQLAlchemyComponent(url=url, prefer_async=prefer_async)
+    assert isinstance(component.engine, engine_class)
+
+
 def test_no_url_or_bind() -> None:
     exc = pytest.raises(TypeError, SQLAlchemyComponent)
     exc.match('both "url" and "bind" cannot be None')
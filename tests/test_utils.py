@@ -4,42 +4,99 @@ from collections.abc import Generator
 from typing import Any
 
 import pytest
-from sqlalchemy.engine import Connection, Engine
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection, Engine, create_engine
 from sqlalchemy.sql.ddl import CreateSchema, DropSchema
+from sqlalchemy.sql.expression import text
 from sqlalchemy.sql.schema import Column, ForeignKey, MetaData, Table
-from sqlalchemy.sql.sqltypes import Integer
+from sqlalchemy.sql.sqltypes import Enum, Integer
 
-from asphalt.sqlalchemy.utils import clear_database
+from asphalt.sqlalchemy.utils import apply_sqlite_hacks, clear_database
 
 
 @pytest.fixture
 def connection(sync_engine: Engine) -> Generator[Connection, Any, None]:
     with sync_engine.connect() as conn:
+        quote = conn.dialect.identifier_preparer.quote
         metadata = MetaData()
-        Table("table", metadata, Column("column1", Integer, primary_key=True))
+        Table(
+            "table",
+            metadata,
+            Column("column1", Integer, primary_key=True),
+            Column("status", Enum("on", "off", name="status")),
+        )
         Table("table2", metadata, Column("fk_column", ForeignKey("table.column1")))
         if conn.dialect.name != "sqlite":
             conn.execute(CreateSchema("altschema"))
-            Table("table3", metadata, Column("fk_column", Integer), schema="altschema")
+            Table(
+                "table3",
+                metadata,
+                Column("fk_column", Integer),
+                Column("status", Enum("on", "off", name="status", schema="altschema")),
+                schema="altschema",
+            )
 
         metadata.create_all(conn)
+        conn.exec_driver_sql(
+            f"CREATE VIEW view1 AS SELECT column1 FROM {quote('table')}"
+        )
+        if conn.dialect.name != "sqlite":
+            conn.exec_driver_sql(
+                "CREATE VIEW altschema.view2 AS SELECT fk_column FROM altschema.table3"
+            )
 
         yield conn
 
         if conn.dialect.name != "sqlite":
+            conn.exec_driver_sql("DROP VIEW IF EXISTS view1")
+            conn.exec_driver_sql("DROP VIEW IF EXISTS altschema.view2")
             metadata.drop_all(conn)
             conn.execute(DropSchema("altschema"))
 
 
 def test_clear_database(connection: Connection) -> None:
-    clear_database(
-        connection, ["altschema"] if connection.dialect.name != "sqlite" else []
-    )
-    metadata = MetaData()
-    metadata.reflect(connection)
-    assert len(metadata.tables) == 0
-
-    if connection.dialect.name != "sqlite":
-        alt_metadata = MetaData(schema="altschema")
-        alt_metadata.reflect(connection)
-        assert len(alt_metadata.tables) == 0
+    schemas = ["altschema"] if connection.dialect.name != "sqlite" else []
+    clear_database(connection, schemas)
+    inspector = inspect(connection)
+    for schema in [None, *schemas]:
+        assert inspector.get_table_names(schema) == []
+        assert inspector.get_view_names(schema) == []
+        if connection.dialect.name == "postgresql":
+            enum_schema = schema or inspector.default_schema_name
+            assert inspector.get_enums(enum_schema) == []  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("foreign_keys", [False, True], ids=["fk_off", "fk_on"])
+def test_clear_sqlite_database(foreign_keys: bool) -> None:
+    engine = create_engine("sqlite:///:memory:")
+    with engine.begin() as conn:
+        if foreign_keys:
+            conn.exec_driver_sql("PRAGMA foreign_keys = ON")
+
+        conn.exec_driver_sql("CREATE TABLE parent (id INTEGER PRIMARY KEY)")
+        conn.exec_driver_sql(
+            "CREATE TABLE child (parent_id INTEGER REFERENCES parent(id))"
+        )
+        conn.exec_driver_sql("CREATE TABLE sqlite1data (id INTEGER PRIMARY KEY)")
+        conn.exec_driver_sql("CREATE VIEW parent_view AS SELECT id FROM parent")
+        conn.exec_driver_sql("INSERT INTO parent VALUES (1)")
+        conn.exec_driver_sql("INSERT INTO child VALUES (1)")
+
+        clear_database(conn)
+        names: list[str] = list(
+            conn.exec_driver_sql("SELECT name FROM sqlite_master").scalars()
+        )
+        assert names == []
+
+    engine.dispose()
+
+
+def test_apply_sqlite_hacks_twice() -> None:
+    """Test that applying the SQLite hacks again does not emit a second BEGIN."""
+    engine = create_engine("sqlite:///:memory:")
+    apply_sqlite_hacks(engine)
+    apply_sqlite_hacks(engine)
+    with engine.begin() as conn:
+        conn.execute(text("SELECT 1"))
+
+    engine.dispose()